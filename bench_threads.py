@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Thread Scaling Benchmark
+Measures treasure generation throughput as worker threads are added.
+
+Run it under both the standard and the free-threaded CPython builds:
+  python bench_threads.py
+  python3.13t bench_threads.py
+On the standard build the GIL keeps scaling near 1x; on the
+free-threaded build throughput should grow with the thread count.
+"""
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from treasure_generator import generate_treasure
+
+
+DEFAULT_HOARDS = 2000
+DEFAULT_MAX_THREADS = 8
+BENCH_CR = 20
+
+
+def gil_enabled() -> bool:
+    """Return whether the running interpreter has the GIL enabled."""
+    is_enabled = getattr(sys, '_is_gil_enabled', None)
+    return True if is_enabled is None else is_enabled()
+
+
+def generate_batch(count: int, barrier: threading.Barrier) -> int:
+    """Generate count hoards once every worker is ready."""
+    barrier.wait()
+    for _ in range(count):
+        generate_treasure(BENCH_CR)
+    return count
+
+
+def run(threads: int, hoards_per_thread: int) -> float:
+    """Return hoards generated per second using the given thread count."""
+    barrier = threading.Barrier(threads + 1)
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        futures = [pool.submit(generate_batch, hoards_per_thread, barrier)
+                   for _ in range(threads)]
+        barrier.wait()
+        start = time.perf_counter()
+        total = sum(f.result() for f in futures)
+        elapsed = time.perf_counter() - start
+    return total / elapsed
+
+
+def main():
+    """Main entry point."""
+    try:
+        hoards = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_HOARDS
+        max_threads = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_MAX_THREADS
+    except ValueError:
+        print("Usage: python bench_threads.py [hoards per thread] [max threads]")
+        sys.exit(1)
+
+    build = "GIL" if gil_enabled() else "free-threaded"
+    print(f"Python {sys.version.split()[0]} ({build} build), CR {BENCH_CR}, "
+          f"{hoards:,} hoards per thread")
+    print(f"{'threads':>8} {'hoards/s':>12} {'speedup':>8} {'efficiency':>11}")
+
+    thread_counts = [1]
+    while thread_counts[-1] * 2 <= max_threads:
+        thread_counts.append(thread_counts[-1] * 2)
+
+    baseline = None
+    for threads in thread_counts:
+        rate = run(threads, hoards)
+        baseline = baseline or rate
+        speedup = rate / baseline
+        print(f"{threads:>8} {rate:>12,.0f} {speedup:>7.2f}x {speedup / threads:>10.0%}")
+
+
+if __name__ == '__main__':
+    main()
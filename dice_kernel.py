@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Dice Kernel
+Shared dice rolling for the dice roller and treasure generator.
+
+The sum of XdY is sampled from a precomputed cumulative distribution
+table using a single uniform draw, instead of rolling every die.
+Tables are built for shapes passed to precompute() and, on first use,
+for small shapes that are cheap to build; every other shape is rolled
+die by die.
+"""
+
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import rng
+
+
+# Shapes larger than this are never tabulated, even by precompute()
+MAX_TABLE_DICE = 32
+MAX_TABLE_SIDES = 100
+
+# Shapes not precomputed get a table on first use only if count * sides
+# is at most this, so arbitrary user notations cannot fill the cache
+# with large tables that take longer to build than many per-die rolls
+MAX_AUTO_TABLE_SIZE = 200
+
+# (count, sides) -> cumulative outcome counts, indexed by (sum - count).
+# Tables are never mutated once stored, so threads may read them freely;
+# two threads racing to build the same table just store equal lists.
+_TABLES: Dict[Tuple[int, int], List[int]] = {}
+
+
+def _build_table(count: int, sides: int) -> List[int]:
+    """Build the cumulative distribution of the sum of count dice."""
+    # ways[i] = number of ways to roll a sum of (dice so far + i)
+    ways = [1]
+    for _ in range(count):
+        # Convolve with one more die using a sliding window sum
+        new_ways = []
+        window = 0
+        for i in range(len(ways) + sides - 1):
+            if i < len(ways):
+                window += ways[i]
+            if i >= sides:
+                window -= ways[i - sides]
+            new_ways.append(window)
+        ways = new_ways
+
+    cumulative = []
+    running = 0
+    for w in ways:
+        running += w
+        cumulative.append(running)
+    return cumulative
+
+
+def _store_table(count: int, sides: int) -> List[int]:
+    """Build and cache the table for a shape."""
+    return _TABLES.setdefault((count, sides), _build_table(count, sides))
+
+
+def _get_table(count: int, sides: int) -> Optional[List[int]]:
+    """Return the table for a shape, building it if it is small enough."""
+    table = _TABLES.get((count, sides))
+    if table is None and count * sides <= MAX_AUTO_TABLE_SIZE:
+        table = _store_table(count, sides)
+    return table
+
+
+def precompute(shapes: Iterable[Tuple[int, int]]) -> None:
+    """Build tables up front for the given (count, sides) shapes."""
+    for count, sides in shapes:
+        if 1 < count <= MAX_TABLE_DICE and 1 <= sides <= MAX_TABLE_SIDES:
+            _store_table(count, sides)
+
+
+def roll_each(count: int, sides: int) -> List[int]:
+    """Roll count dice individually and return every result."""
+    randint = rng.get_instance().randint
+    return [randint(1, sides) for _ in range(count)]
+
+
+def roll_sum(count: int, sides: int) -> int:
+    """Roll count dice with the given sides and return only the total."""
+    if sides < 1:
+        raise ValueError("Dice must have at least one side")
+    if count < 1:
+        return 0
+    rand = rng.get_instance()
+    if count == 1:
+        return rand.randint(1, sides)
+
+    table = _get_table(count, sides)
+    if table is None:
+        return sum(roll_each(count, sides))
+
+    # table[-1] == sides ** count, so one draw picks a uniform outcome
+    return count + bisect_right(table, rand.randrange(table[-1]))
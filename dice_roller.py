@@ -5,9 +5,16 @@ Supports standard dice notation: XdY+Z
 where X = number of dice, Y = sides per die, Z = modifier
 """
 
-import random
+import json
+import logging
 import re
 import sys
+import threading
+
+import dice_kernel
+from roll_stats import RollStats
+
+logger = logging.getLogger(__name__)
 
 
 class DiceRoller:
@@ -16,18 +23,24 @@ class DiceRoller:
     # Standard DnD dice types
     VALID_DICE = [4, 6, 8, 10, 12, 20, 100]
 
+    # Notations already warned about, shared by all rollers; cleared when
+    # full so user-supplied notations cannot grow it without bound
+    MAX_WARNED = 256
+    _warned = set()
+    _warned_lock = threading.Lock()
+
     def __init__(self):
         self.pattern = re.compile(r'^(\d+)?d(\d+)([+-]\d+)?$', re.IGNORECASE)
 
-    def roll(self, notation):
+    def parse(self, notation):
         """
-        Roll dice based on standard notation.
+        Parse standard notation into its parts.
 
         Args:
             notation: String like "2d6", "1d20+5", "3d8-2"
 
         Returns:
-            Dictionary with roll details
+            Tuple of (notation, num_dice, die_type, modifier)
         """
         notation = notation.strip().lower().replace(' ', '')
         match = self.pattern.match(notation)
@@ -39,14 +52,42 @@ class DiceRoller:
         die_type = int(match.group(2))
         modifier = int(match.group(3)) if match.group(3) else 0
 
+        if die_type < 1:
+            raise ValueError("Dice must have at least one side")
+
         if die_type not in self.VALID_DICE:
-            print(f"Warning: d{die_type} is not a standard DnD die, but rolling anyway...")
+            self._warn_nonstandard(notation, die_type)
 
         if num_dice < 1 or num_dice > 100:
             raise ValueError("Number of dice must be between 1 and 100")
 
+        return notation, num_dice, die_type, modifier
+
+    def _warn_nonstandard(self, notation, die_type):
+        """Log a non-standard die warning once per notation."""
+        with self._warned_lock:
+            if notation in self._warned:
+                return
+            if len(self._warned) >= self.MAX_WARNED:
+                self._warned.clear()
+            self._warned.add(notation)
+        logger.warning("%s: d%d is not a standard DnD die, but rolling anyway...",
+                       notation, die_type)
+
+    def roll(self, notation):
+        """
+        Roll dice based on standard notation.
+
+        Args:
+            notation: String like "2d6", "1d20+5", "3d8-2"
+
+        Returns:
+            Dictionary with roll details
+        """
+        notation, num_dice, die_type, modifier = self.parse(notation)
+
         # Roll the dice
-        rolls = [random.randint(1, die_type) for _ in range(num_dice)]
+        rolls = dice_kernel.roll_each(num_dice, die_type)
         total = sum(rolls) + modifier
 
         return {
@@ -59,6 +100,38 @@ class DiceRoller:
             'total': total
         }
 
+    def roll_total(self, notation):
+        """
+        Roll dice based on standard notation, returning only the total.
+
+        Faster than roll() since individual dice are not kept.
+        """
+        _, num_dice, die_type, modifier = self.parse(notation)
+        return dice_kernel.roll_sum(num_dice, die_type) + modifier
+
+    def stats(self, notation, times):
+        """
+        Roll dice many times, keeping only running statistics.
+
+        Args:
+            notation: String like "2d6", "1d20+5", "3d8-2"
+            times: Number of rolls
+
+        Returns:
+            RollStats summarizing the totals
+        """
+        if times < 1:
+            raise ValueError("Number of rolls must be at least 1")
+
+        notation, num_dice, die_type, modifier = self.parse(notation)
+        stats = RollStats(num_dice + modifier, num_dice * die_type + modifier)
+
+        roll_sum = dice_kernel.roll_sum
+        for _ in range(times):
+            stats.add(roll_sum(num_dice, die_type) + modifier)
+
+        return stats
+
     def format_result(self, result):
         """Format roll result for display."""
         rolls_str = ', '.join(str(r) for r in result['rolls'])
@@ -79,6 +152,9 @@ class DiceRoller:
         return '\n'.join(output)
 
 
+DEFAULT_STATS_ROLLS = 10000
+
+
 def print_usage():
     """Print usage information."""
     print("""
@@ -87,6 +163,7 @@ DnD Dice Roller
 
 Usage:
   python dice_roller.py [dice notation]
+  python dice_roller.py --stats N [--json] [dice notation]
 
 Dice Notation:
   XdY     - Roll X dice with Y sides each
@@ -99,6 +176,12 @@ Examples:
   1d20+5      - Roll one 20-sided die and add 5
   4d6-2       - Roll four 6-sided dice and subtract 2
 
+Statistics:
+  --stats N   - Roll each notation N times and summarize the totals
+  --json      - Print the summary as JSON
+
+  In interactive mode: stats 1d20+5 100000
+
 Standard DnD Dice: d4, d6, d8, d10, d12, d20, d100
 
 Interactive mode: Run without arguments to enter interactive mode
@@ -127,6 +210,19 @@ def interactive_mode():
             if not notation:
                 continue
 
+            if notation.lower().split()[0] == 'stats':
+                args = notation.split()[1:]
+                if len(args) == 2 and args[1].isdigit():
+                    times = int(args[1])
+                elif len(args) == 1:
+                    times = DEFAULT_STATS_ROLLS
+                else:
+                    print("Usage: stats <dice notation> [times]")
+                    continue
+                stats = roller.stats(args[0], times)
+                print(stats.format_summary(f"Rolling {args[0]} x{times:,}"))
+                continue
+
             result = roller.roll(notation)
             print(roller.format_result(result))
 
@@ -140,6 +236,38 @@ def interactive_mode():
             break
 
 
+def stats_mode(roller, args):
+    """Summarize many rolls of each notation given on the command line."""
+    as_json = '--json' in args
+    args = [a for a in args if a != '--json']
+
+    try:
+        times = int(args[0])
+    except (IndexError, ValueError):
+        print("Error: --stats requires a number of rolls")
+        sys.exit(1)
+
+    if len(args) < 2:
+        print("Error: --stats requires at least one dice notation")
+        sys.exit(1)
+
+    summaries = {}
+    for notation in args[1:]:
+        try:
+            stats = roller.stats(notation, times)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+
+        if as_json:
+            summaries[notation] = stats.to_dict()
+        else:
+            print(stats.format_summary(f"Rolling {notation} x{times:,}"))
+
+    if as_json:
+        print(json.dumps(summaries, indent=2))
+
+
 def main():
     """Main entry point."""
     roller = DiceRoller()
@@ -149,6 +277,8 @@ def main():
         interactive_mode()
     elif len(sys.argv) == 2 and sys.argv[1] in ['-h', '--help', 'help']:
         print_usage()
+    elif sys.argv[1] == '--stats':
+        stats_mode(roller, sys.argv[2:])
     else:
         # Roll each dice notation provided as argument
         for notation in sys.argv[1:]:
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Magic Item Drop Catalog
+Exact odds of every reachable magic item appearing in a hoard, per CR.
+
+Probabilities are enumerated from the same option tables the treasure
+generator draws from, using exact fractions, so the catalog always
+agrees with generate_treasure without any simulation.
+"""
+
+import sys
+from collections import Counter, defaultdict
+from fractions import Fraction
+from itertools import permutations
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from treasure_generator import (
+    ARMOR_TYPES, TREASURE_TABLES, WAND_CHARGES, WEAPON_TYPES,
+    armor_enhancements, get_armor_price, get_weapon_price, item_count_options,
+    item_type_table, potion_options, ring_options, scroll_options, wand_options,
+    weapon_description, weapon_options, wondrous_options,
+)
+
+
+MIN_CR = 1
+MAX_CR = 20
+
+
+class DropEntry(NamedTuple):
+    """Odds of one item at one CR."""
+    cr: int
+    category: str
+    name: str
+    price: int
+    slot_chance: Fraction  # Chance a single magic item slot yields it
+    expected_count: Fraction  # Expected number per hoard
+    hoard_chance: Fraction  # Chance a hoard holds at least one
+
+
+def _uniform(options: List) -> Dict:
+    """Return the distribution of a uniform choice, merging duplicates."""
+    counts = Counter(options)
+    return {option: Fraction(n, len(options)) for option, n in counts.items()}
+
+
+def _weapon_odds(cr: int) -> Dict[Tuple[str, int], Fraction]:
+    """Return the odds of each weapon given that a weapon is generated."""
+    enhancements, brand_chance, brand_pool, brand_counts = weapon_options(cr)
+    brand_chance = Fraction(str(brand_chance))
+
+    # Brand lists come from sampling, so every ordering is a distinct result
+    brand_odds = defaultdict(Fraction)
+    if brand_chance < 1:
+        brand_odds[()] += 1 - brand_chance
+    if brand_chance > 0:
+        for count, p_count in _uniform(brand_counts).items():
+            combos = list(permutations(brand_pool, count))
+            for combo in combos:
+                brand_odds[combo] += brand_chance * p_count / len(combos)
+
+    p_type = Fraction(1, len(WEAPON_TYPES))
+    odds = defaultdict(Fraction)
+    for enhancement, p_enh in _uniform(enhancements).items():
+        for brands, p_brands in brand_odds.items():
+            price = get_weapon_price(enhancement, list(brands))
+            for weapon_type in WEAPON_TYPES:
+                name = weapon_description(enhancement, list(brands), weapon_type)
+                odds[(name, price)] += p_enh * p_brands * p_type
+    return odds
+
+
+def _armor_odds(cr: int) -> Dict[Tuple[str, int], Fraction]:
+    """Return the odds of each armor given that armor is generated."""
+    p_type = Fraction(1, len(ARMOR_TYPES))
+    odds = defaultdict(Fraction)
+    for enhancement, p_enh in _uniform(armor_enhancements(cr)).items():
+        price = get_armor_price(enhancement)
+        for armor_type in ARMOR_TYPES:
+            odds[(f"+{enhancement} {armor_type}", price)] += p_enh * p_type
+    return odds
+
+
+def _category_odds(category: str, cr: int) -> Dict[Tuple[str, int], Fraction]:
+    """Return the odds of each item given that its category is generated."""
+    if category == 'weapon':
+        return _weapon_odds(cr)
+    if category == 'armor':
+        return _armor_odds(cr)
+    if category == 'potion':
+        options = [(f"Potion of {name}", price) for name, price in potion_options(cr)]
+    elif category == 'scroll':
+        options = [(f"Scroll of {spell}", price) for spell, price, _ in scroll_options(cr)]
+    elif category == 'wand':
+        options = [(f"Wand of {spell} ({WAND_CHARGES} charges)", price)
+                   for spell, price in wand_options(cr)]
+    elif category == 'ring':
+        options = ring_options(cr)
+    elif category == 'wondrous':
+        options = wondrous_options(cr)
+    else:
+        raise ValueError(f"Unknown item category: {category}")
+    return _uniform(options)
+
+
+def enumerate_drops(cr: int) -> List[DropEntry]:
+    """Compute the exact odds of every item reachable at a CR."""
+    cr = min(MAX_CR, max(MIN_CR, cr))
+
+    # Distribution of the number of item slots in a hoard
+    items_chance = Fraction(str(TREASURE_TABLES[cr]['items']))
+    if items_chance == 0:
+        return []
+    slot_counts = {n: items_chance * p for n, p in _uniform(item_count_options(cr)).items()}
+    expected_slots = sum(n * p for n, p in slot_counts.items())
+
+    entries = []
+    previous = Fraction(0)
+    for threshold, category in item_type_table(cr):
+        threshold = Fraction(str(threshold))
+        p_category = threshold - previous
+        previous = threshold
+
+        for (name, price), p_item in _category_odds(category, cr).items():
+            q = p_category * p_item
+            hoard_chance = sum(p * (1 - (1 - q) ** n) for n, p in slot_counts.items())
+            entries.append(DropEntry(cr, category, name, price, q,
+                                     expected_slots * q, hoard_chance))
+
+    return entries
+
+
+class DropCatalog:
+    """Queryable table of item drop odds, computed once per CR on demand."""
+
+    def __init__(self):
+        self._tables: Dict[int, Dict[str, DropEntry]] = {}
+
+    def table(self, cr: int) -> Dict[str, DropEntry]:
+        """Return the entries for a CR keyed by item name."""
+        cr = min(MAX_CR, max(MIN_CR, cr))
+        if cr not in self._tables:
+            self._tables[cr] = {e.name: e for e in enumerate_drops(cr)}
+        return self._tables[cr]
+
+    def lookup(self, name: str, cr: int) -> Optional[DropEntry]:
+        """Return the entry for an item at a CR, or None if unreachable."""
+        return self.table(cr).get(name)
+
+    def odds_by_cr(self, name: str) -> List[DropEntry]:
+        """Return the entry for an item at every CR where it can drop."""
+        entries = [self.lookup(name, cr) for cr in range(MIN_CR, MAX_CR + 1)]
+        return [e for e in entries if e is not None]
+
+    def query(self, cr: Optional[int] = None, category: Optional[str] = None,
+              min_price: Optional[int] = None, max_price: Optional[int] = None,
+              name_contains: Optional[str] = None) -> List[DropEntry]:
+        """Return matching entries, most likely first."""
+        crs = [cr] if cr is not None else range(MIN_CR, MAX_CR + 1)
+        needle = name_contains.lower() if name_contains else None
+
+        results = []
+        for c in crs:
+            for entry in self.table(c).values():
+                if category is not None and entry.category != category:
+                    continue
+                if min_price is not None and entry.price < min_price:
+                    continue
+                if max_price is not None and entry.price > max_price:
+                    continue
+                if needle is not None and needle not in entry.name.lower():
+                    continue
+                results.append(entry)
+
+        results.sort(key=lambda e: (-e.hoard_chance, e.cr, e.name))
+        return results
+
+
+def format_entry(entry: DropEntry) -> str:
+    """Format a catalog entry for display."""
+    chance = entry.hoard_chance
+    one_in = f"1 in {float(1 / chance):,.0f}" if chance else "never"
+    return (f"  CR {entry.cr:>2}: {entry.name} ({entry.price:,} gp) - "
+            f"{float(chance):.6%} per hoard ({one_in})")
+
+
+def print_usage():
+    """Print usage information."""
+    print("""
+Magic Item Drop Catalog
+=======================
+
+Usage:
+  python drop_catalog.py "item name" [CR]
+  python drop_catalog.py --top CR [N]
+
+Examples:
+  python drop_catalog.py "+2 flaming longsword" 11
+  python drop_catalog.py "boots of speed"
+  python drop_catalog.py --top 15 20
+""")
+
+
+def main():
+    """Main entry point."""
+    if len(sys.argv) < 2 or sys.argv[1] in ['-h', '--help', 'help']:
+        print_usage()
+        return
+
+    catalog = DropCatalog()
+
+    try:
+        if sys.argv[1] == '--top':
+            cr = int(sys.argv[2])
+            limit = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+            for entry in catalog.query(cr=cr)[:limit]:
+                print(format_entry(entry))
+            return
+
+        name = sys.argv[1]
+        if len(sys.argv) > 2:
+            entry = catalog.lookup(name, int(sys.argv[2]))
+            entries = [entry] if entry else []
+        else:
+            entries = catalog.odds_by_cr(name)
+    except (IndexError, ValueError):
+        print("Error: CR must be a number")
+        print_usage()
+        sys.exit(1)
+
+    if not entries:
+        print(f"No drop odds found for {name}")
+        sys.exit(1)
+
+    for entry in entries:
+        print(format_entry(entry))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""
+Distribution Equivalence Harness
+Checks that the optimized dice and treasure engines keep the original odds.
+
+Each case is sampled N times with the reference engine (the frozen
+original code in baseline.py, drawing from the random module and
+rolling every die) and with the current engine (per-thread generators,
+table-driven dice sums). The two samples are compared with a chi-square
+test of homogeneity and a two-sample Kolmogorov-Smirnov test, and the
+report shows the speedup next to each verdict.
+
+The reference keeps the original tables, so deliberate table edits in
+treasure_generator are reported as DIFFERS.
+"""
+
+import json
+import math
+import random
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, NamedTuple, Tuple
+
+import baseline
+import rng
+import treasure_generator
+from dice_roller import DiceRoller
+from treasure_generator import DICE_SHAPES, ITEM_GENERATORS, item_category
+
+
+DICE_NOTATIONS = [
+    'd4', 'd6', 'd8', 'd10', 'd12', 'd20', 'd100',
+    '2d6', '3d6', '4d6', '2d8', '3d8', '4d10', '6d12', '10d10',
+    '1d20+5', '4d6-2', '40d6',
+]
+TREASURE_CRS = range(1, 21)
+
+DEFAULT_DICE_SAMPLES = 100000
+DEFAULT_TREASURE_SAMPLES = 5000
+
+# Many tests run at once, so a strict level keeps false alarms rare
+DEFAULT_ALPHA = 0.001
+
+# Chi-square bins are merged until each expects at least this many hits
+MIN_EXPECTED = 5
+
+
+class TestResult(NamedTuple):
+    """Outcome of comparing one metric between the two engines."""
+    engine: str
+    case: str
+    metric: str
+    test: str
+    statistic: float
+    p_value: float
+    reference_seconds: float
+    candidate_seconds: float
+
+    @property
+    def speedup(self) -> float:
+        return self.reference_seconds / self.candidate_seconds if self.candidate_seconds else math.inf
+
+    def passed(self, alpha: float = DEFAULT_ALPHA) -> bool:
+        return self.p_value >= alpha
+
+
+# ============================================================================
+# STATISTICAL TESTS
+# ============================================================================
+
+def _gamma_q(a: float, x: float) -> float:
+    """Regularized upper incomplete gamma function Q(a, x)."""
+    if x <= 0:
+        return 1.0
+    log_prefix = -x + a * math.log(x) - math.lgamma(a)
+
+    if x < a + 1:
+        # Series for P(a, x)
+        term = total = 1.0 / a
+        ap = a
+        for _ in range(10000):
+            ap += 1
+            term *= x / ap
+            total += term
+            if abs(term) < abs(total) * 1e-15:
+                break
+        return max(0.0, 1.0 - total * math.exp(log_prefix))
+
+    # Continued fraction for Q(a, x) (modified Lentz)
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 10000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return math.exp(log_prefix) * h
+
+
+def chi_square_test(a: Counter, b: Counter) -> Tuple[float, int, float]:
+    """
+    Chi-square test that two samples come from the same distribution.
+
+    Returns:
+        Tuple of (statistic, degrees of freedom, p-value)
+    """
+    n_a = sum(a.values())
+    n_b = sum(b.values())
+    if not n_a or not n_b:
+        return 0.0, 0, 1.0
+
+    # Merge neighbouring outcomes until every bin has enough expected hits
+    smaller_share = min(n_a, n_b) / (n_a + n_b)
+    bins = []
+    count_a = count_b = 0
+    for key in sorted(set(a) | set(b)):
+        count_a += a.get(key, 0)
+        count_b += b.get(key, 0)
+        if (count_a + count_b) * smaller_share >= MIN_EXPECTED:
+            bins.append((count_a, count_b))
+            count_a = count_b = 0
+    if count_a or count_b:
+        if bins:
+            last_a, last_b = bins.pop()
+            bins.append((last_a + count_a, last_b + count_b))
+        else:
+            bins.append((count_a, count_b))
+
+    df = len(bins) - 1
+    if df < 1:
+        return 0.0, 0, 1.0
+
+    scale_a = math.sqrt(n_b / n_a)
+    scale_b = math.sqrt(n_a / n_b)
+    statistic = sum((x * scale_a - y * scale_b) ** 2 / (x + y) for x, y in bins)
+    return statistic, df, _gamma_q(df / 2, statistic / 2)
+
+
+def _kolmogorov_q(lam: float) -> float:
+    """Survival function of the Kolmogorov distribution."""
+    if lam < 0.27:
+        return 1.0
+    total = 0.0
+    for j in range(1, 101):
+        term = 2 * (-1) ** (j - 1) * math.exp(-2 * j * j * lam * lam)
+        total += term
+        if abs(term) < 1e-12:
+            break
+    return min(1.0, max(0.0, total))
+
+
+def ks_test(a: Counter, b: Counter) -> Tuple[float, float]:
+    """
+    Two-sample Kolmogorov-Smirnov test on value counts.
+
+    Returns:
+        Tuple of (largest CDF gap, p-value); conservative for discrete data
+    """
+    n_a = sum(a.values())
+    n_b = sum(b.values())
+    if not n_a or not n_b:
+        return 0.0, 1.0
+
+    cdf_a = cdf_b = 0
+    gap = 0.0
+    for key in sorted(set(a) | set(b)):
+        cdf_a += a.get(key, 0)
+        cdf_b += b.get(key, 0)
+        gap = max(gap, abs(cdf_a / n_a - cdf_b / n_b))
+
+    effective_n = math.sqrt(n_a * n_b / (n_a + n_b))
+    return gap, _kolmogorov_q((effective_n + 0.12 + 0.11 / effective_n) * gap)
+
+
+# ============================================================================
+# ENGINES
+# ============================================================================
+
+@contextmanager
+def reference_engine(seed: int) -> Iterator[None]:
+    """Seed the random module for the original code, restoring it afterwards."""
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        yield
+    finally:
+        random.setstate(state)
+
+
+@contextmanager
+def candidate_engine(seed: int) -> Iterator[None]:
+    """Draw from a per-thread random.Random with table-driven dice sums."""
+    with rng.using(random.Random(seed)):
+        yield
+
+
+def _timed(engine: Callable, seed: int, sample: Callable[[], None]) -> float:
+    """Run sample() under an engine and return the elapsed seconds."""
+    with engine(seed):
+        start = time.perf_counter()
+        sample()
+        return time.perf_counter() - start
+
+
+def _compare(engine: str, case: str, metric: str, a: Counter, b: Counter,
+             ref_seconds: float, alt_seconds: float, chi_square: bool = True,
+             ks: bool = True) -> List[TestResult]:
+    """Run the requested tests on two samples of one metric."""
+    results = []
+    if chi_square:
+        statistic, _, p = chi_square_test(a, b)
+        results.append(TestResult(engine, case, metric, 'chi2', statistic, p,
+                                  ref_seconds, alt_seconds))
+    if ks:
+        statistic, p = ks_test(a, b)
+        results.append(TestResult(engine, case, metric, 'ks', statistic, p,
+                                  ref_seconds, alt_seconds))
+    return results
+
+
+def check_roll_dice(samples: int, seed: int) -> List[TestResult]:
+    """Compare roll_dice against the original for every treasure shape."""
+    results = []
+    for num, sides in DICE_SHAPES:
+        def sample(roll_dice: Callable, totals: Counter) -> None:
+            for _ in range(samples):
+                totals[roll_dice(num, sides)] += 1
+
+        ref, alt = Counter(), Counter()
+        ref_seconds = _timed(reference_engine, seed,
+                             lambda: sample(baseline.roll_dice, ref))
+        alt_seconds = _timed(candidate_engine, seed + 1,
+                             lambda: sample(treasure_generator.roll_dice, alt))
+        results += _compare('roll_dice', f"{num}d{sides}", 'total', ref, alt,
+                            ref_seconds, alt_seconds)
+    return results
+
+
+def check_dice_roller(samples: int, seed: int) -> List[TestResult]:
+    """Compare DiceRoller totals against the original roll() algorithm."""
+    roller = DiceRoller()
+    baseline_roller = baseline.DiceRoller()
+    results = []
+    for notation in DICE_NOTATIONS:
+        def reference(totals: Counter) -> None:
+            for _ in range(samples):
+                totals[baseline_roller.roll(notation)['total']] += 1
+
+        def roll(totals: Counter) -> None:
+            for _ in range(samples):
+                totals[roller.roll(notation)['total']] += 1
+
+        def roll_total(totals: Counter) -> None:
+            for _ in range(samples):
+                totals[roller.roll_total(notation)] += 1
+
+        ref = Counter()
+        ref_seconds = _timed(reference_engine, seed, lambda: reference(ref))
+        for name, candidate in (('DiceRoller.roll', roll), ('DiceRoller.roll_total', roll_total)):
+            alt = Counter()
+            alt_seconds = _timed(candidate_engine, seed + 1, lambda: candidate(alt))
+            results += _compare(name, notation, 'total', ref, alt, ref_seconds, alt_seconds)
+    return results
+
+
+def _treasure_metrics(generate_treasure: Callable, cr: int,
+                      samples: int) -> Dict[str, Counter]:
+    """Generate hoards and count the values of each metric."""
+    metrics = {'total': Counter(), 'items': Counter(), 'goods': Counter()}
+    for coin_type in ('cp', 'sp', 'gp', 'pp'):
+        metrics[coin_type] = Counter()
+
+    for _ in range(samples):
+        hoard = generate_treasure(cr)
+        metrics['total'][hoard.total_value()] += 1
+        for coin_type in ('cp', 'sp', 'gp', 'pp'):
+            metrics[coin_type][hoard.coins.get(coin_type, 0)] += 1
+        metrics['goods'][len(hoard.goods)] += 1
+        for item_desc, _ in hoard.items:
+            metrics['items'][item_category(item_desc)] += 1
+    return metrics
+
+
+def check_generate_treasure(samples: int, seed: int) -> List[TestResult]:
+    """Compare whole hoards at every CR."""
+    categories = list(ITEM_GENERATORS)
+    results = []
+    for cr in TREASURE_CRS:
+        box = {}
+        ref_seconds = _timed(reference_engine, seed + cr,
+                             lambda: box.update(ref=_treasure_metrics(
+                                 baseline.generate_treasure, cr, samples)))
+        alt_seconds = _timed(candidate_engine, seed + cr + 1000,
+                             lambda: box.update(alt=_treasure_metrics(
+                                 treasure_generator.generate_treasure, cr, samples)))
+        ref, alt = box['ref'], box['alt']
+
+        for metric in ref:
+            # Item categories are unordered, so only chi-square applies
+            ordered = metric != 'items'
+            a, b = ref[metric], alt[metric]
+            if not ordered:
+                a = Counter({categories.index(k): v for k, v in a.items()})
+                b = Counter({categories.index(k): v for k, v in b.items()})
+            results += _compare('generate_treasure', f"CR {cr}", metric, a, b,
+                                ref_seconds, alt_seconds, ks=ordered)
+    return results
+
+
+# ============================================================================
+# REPORTING
+# ============================================================================
+
+def run_all(dice_samples: int = DEFAULT_DICE_SAMPLES,
+            treasure_samples: int = DEFAULT_TREASURE_SAMPLES,
+            seed: int = 0) -> List[TestResult]:
+    """Run every comparison."""
+    return (check_roll_dice(dice_samples, seed)
+            + check_dice_roller(dice_samples, seed)
+            + check_generate_treasure(treasure_samples, seed))
+
+
+def format_report(results: List[TestResult], alpha: float = DEFAULT_ALPHA) -> str:
+    """Format results as a table with a closing verdict."""
+    lines = [f"{'ENGINE':<22} {'CASE':<8} {'METRIC':<6} {'TEST':<5} "
+             f"{'STAT':>10} {'P-VALUE':>8} {'VERDICT':<8} {'SPEEDUP':>8}"]
+    for r in results:
+        verdict = 'same' if r.passed(alpha) else 'DIFFERS'
+        lines.append(f"{r.engine:<22} {r.case:<8} {r.metric:<6} {r.test:<5} "
+                     f"{r.statistic:>10.4f} {r.p_value:>8.4f} {verdict:<8} {r.speedup:>7.2f}x")
+
+    failures = [r for r in results if not r.passed(alpha)]
+    # Several tests per case share a timing, so count each case once
+    timings = {(r.engine, r.case): r for r in results}
+    for engine in dict.fromkeys(r.engine for r in results):
+        ref = sum(r.reference_seconds for k, r in timings.items() if k[0] == engine)
+        alt = sum(r.candidate_seconds for k, r in timings.items() if k[0] == engine)
+        lines.append(f"{engine}: overall speedup {ref / alt:.2f}x")
+
+    lines.append(f"{len(results) - len(failures)}/{len(results)} tests consistent "
+                 f"with identical distributions at alpha={alpha}")
+    if failures:
+        expected = len(results) * alpha
+        lines.append(f"{len(failures)} flagged (about {expected:.1f} expected by chance); "
+                     f"rerun with another seed to confirm")
+    return '\n'.join(lines)
+
+
+def print_usage():
+    """Print usage information."""
+    print(f"""
+Distribution Equivalence Harness
+================================
+
+Usage:
+  python equivalence_harness.py [dice samples] [treasure samples] [--seed S] [--json]
+
+Defaults: {DEFAULT_DICE_SAMPLES:,} dice rolls per notation and
+{DEFAULT_TREASURE_SAMPLES:,} hoards per CR for each engine.
+""")
+
+
+def main():
+    """Main entry point."""
+    args = sys.argv[1:]
+    if args and args[0] in ['-h', '--help', 'help']:
+        print_usage()
+        return
+
+    as_json = '--json' in args
+    args = [a for a in args if a != '--json']
+    seed = 0
+    try:
+        if '--seed' in args:
+            i = args.index('--seed')
+            seed = int(args[i + 1])
+            del args[i:i + 2]
+        dice_samples = int(args[0]) if len(args) > 0 else DEFAULT_DICE_SAMPLES
+        treasure_samples = int(args[1]) if len(args) > 1 else DEFAULT_TREASURE_SAMPLES
+    except (IndexError, ValueError):
+        print_usage()
+        sys.exit(1)
+
+    results = run_all(dice_samples, treasure_samples, seed)
+
+    if as_json:
+        print(json.dumps([dict(r._asdict(), speedup=r.speedup, passed=r.passed())
+                          for r in results], indent=2))
+    else:
+        print(format_report(results))
+
+    if any(not r.passed() for r in results):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
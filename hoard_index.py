@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Hoard Index
+Searchable collection of generated treasure hoards.
+
+Hoards are indexed as they are appended: an inverted index maps each
+magic item and good to the hoards holding it, each CR maps to its hoard
+IDs, and a sorted index on total value answers range queries with a
+binary search. New values are appended unsorted and the value index is
+sorted once, on the next query that needs it, so building a collection
+is O(n log n) rather than one insertion sort per hoard.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from treasure_generator import TreasureHoard
+
+
+class HoardCollection:
+    """Append-only collection of hoards with incremental indexes."""
+
+    def __init__(self, hoards: Iterable[TreasureHoard] = ()):
+        self._hoards: List[TreasureHoard] = []
+        self._values: List[int] = []
+        self._crs: List[int] = []
+        self._by_name: Dict[str, Set[int]] = defaultdict(set)
+        self._by_value: List[Tuple[int, int]] = []  # (value, hoard id)
+        self._by_value_sorted = True
+        self._by_cr: Dict[int, List[int]] = defaultdict(list)  # IDs in order
+        self.extend(hoards)
+
+    def __len__(self) -> int:
+        return len(self._hoards)
+
+    def __getitem__(self, hoard_id: int) -> TreasureHoard:
+        return self._hoards[hoard_id]
+
+    def __iter__(self) -> Iterator[TreasureHoard]:
+        return iter(self._hoards)
+
+    def append(self, hoard: TreasureHoard) -> int:
+        """Add a hoard, update the indexes and return its ID."""
+        hoard_id = len(self._hoards)
+        value = hoard.total_value()
+
+        self._hoards.append(hoard)
+        self._values.append(value)
+        self._crs.append(hoard.cr)
+
+        for name in self._names(hoard):
+            self._by_name[name].add(hoard_id)
+        if self._by_value and value < self._by_value[-1][0]:
+            self._by_value_sorted = False
+        self._by_value.append((value, hoard_id))
+        self._by_cr[hoard.cr].append(hoard_id)
+
+        return hoard_id
+
+    def extend(self, hoards: Iterable[TreasureHoard]) -> None:
+        """Add several hoards."""
+        for hoard in hoards:
+            self.append(hoard)
+
+    @staticmethod
+    def _names(hoard: TreasureHoard) -> Set[str]:
+        """Return the searchable names of everything in a hoard."""
+        names = {desc for desc, _ in hoard.items}
+        for desc, _ in hoard.goods:
+            # Goods are searchable by full description or by object name
+            names.add(desc)
+            names.add(desc.split(': ', 1)[-1])
+        return names
+
+    def value(self, hoard_id: int) -> int:
+        """Return the cached total value of a hoard."""
+        return self._values[hoard_id]
+
+    def contains(self, name: str) -> Set[int]:
+        """Return the IDs of hoards holding an item or good."""
+        return set(self._by_name.get(name, ()))
+
+    def _value_bounds(self, low: Optional[int], high: Optional[int]) -> Tuple[int, int]:
+        """Return the start and end positions of [low, high] in the value index."""
+        index = self._by_value
+        if not self._by_value_sorted:
+            index.sort()
+            self._by_value_sorted = True
+        start = 0 if low is None else bisect_left(index, (low, -1))
+        end = len(index) if high is None else bisect_right(index, (high, len(index)))
+        return start, end
+
+    def find(self, contains: Iterable[str] = (), cr: Optional[int] = None,
+             min_cr: Optional[int] = None, max_cr: Optional[int] = None,
+             min_value: Optional[int] = None, max_value: Optional[int] = None) -> List[int]:
+        """
+        Return the IDs of hoards matching every given filter.
+
+        Args:
+            contains: Item or good names that must all be present
+            cr: Exact CR, shorthand for min_cr == max_cr == cr
+            min_cr, max_cr: Inclusive CR range
+            min_value, max_value: Inclusive total value range in GP
+
+        Returns:
+            Matching hoard IDs in insertion order
+        """
+        if cr is not None:
+            min_cr = max_cr = cr
+
+        name_sets = [self._by_name.get(name, set()) for name in contains]
+
+        low_cr = float('-inf') if min_cr is None else min_cr
+        high_cr = float('inf') if max_cr is None else max_cr
+        low_value = float('-inf') if min_value is None else min_value
+        high_value = float('inf') if max_value is None else max_value
+
+        # Drive the search from the most selective index
+        drivers = [(len(ids), ids) for ids in name_sets]
+        if min_cr is not None or max_cr is not None:
+            cr_lists = [ids for c, ids in self._by_cr.items() if low_cr <= c <= high_cr]
+            drivers.append((sum(map(len, cr_lists)), cr_lists))
+        if min_value is not None or max_value is not None:
+            start, end = self._value_bounds(min_value, max_value)
+            drivers.append((end - start, (start, end)))
+        if not drivers:
+            return list(range(len(self._hoards)))
+
+        _, driver = min(drivers, key=lambda d: d[0])
+        if isinstance(driver, tuple):
+            start, end = driver
+            candidates = [i for _, i in self._by_value[start:end]]
+        elif isinstance(driver, list):
+            candidates = [i for ids in driver for i in ids]
+        else:
+            candidates = driver
+
+        matches = [
+            i for i in candidates
+            if all(i in ids for ids in name_sets)
+            and low_cr <= self._crs[i] <= high_cr
+            and low_value <= self._values[i] <= high_value
+        ]
+        matches.sort()
+        return matches
+
+    def select(self, **filters) -> List[TreasureHoard]:
+        """Return the hoards matching the filters accepted by find()."""
+        return [self._hoards[i] for i in self.find(**filters)]
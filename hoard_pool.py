@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Hoard Pool
+Pre-generated treasure hoards for serving loot without generation latency.
+
+Each CR has a bounded ring buffer of ready hoards. take() pops from it
+in O(1); when a buffer falls below its low watermark, a background
+thread tops it back up to capacity. If a buffer is empty the hoard is
+generated on the spot and counted as a miss.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, Optional
+
+from treasure_generator import TreasureHoard, generate_treasure
+
+
+DEFAULT_CAPACITY = 32
+
+
+class HoardPool:
+    """Per-CR buffers of ready hoards refilled by a background thread."""
+
+    def __init__(self, crs: Iterable[int] = range(1, 21),
+                 capacity: int = DEFAULT_CAPACITY,
+                 low_watermark: Optional[int] = None,
+                 generator: Callable[[int], TreasureHoard] = generate_treasure):
+        """
+        Args:
+            crs: CRs to keep hoards ready for
+            capacity: Maximum ready hoards per CR
+            low_watermark: Refill a CR once it holds fewer hoards than this
+                (defaults to half the capacity)
+            generator: Function that generates a hoard for a CR
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+        if low_watermark is None:
+            low_watermark = max(1, capacity // 2)
+        if not 0 < low_watermark <= capacity:
+            raise ValueError("Low watermark must be between 1 and capacity")
+
+        self.capacity = capacity
+        self.low_watermark = low_watermark
+        self._generator = generator
+        self._pools: Dict[int, Deque[TreasureHoard]] = {
+            cr: deque(maxlen=capacity) for cr in crs
+        }
+
+        # CR -> time it fell below the low watermark, until refilled
+        self._low_since: Dict[int, float] = {}
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._hits = 0
+        self._misses = 0
+        self._refills = 0
+        self._generated = 0
+        self._lag_total = 0.0
+        self._lag_max = 0.0
+        self._lag_last = 0.0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> 'HoardPool':
+        """Start the background refill thread; every CR is filled first."""
+        if self._thread is not None:
+            if not self._stopping.is_set():
+                return self
+            # A previous stop() timed out; wait for that thread to exit so
+            # two refill threads never run at once
+            self._thread.join()
+            self._thread = None
+
+        now = time.monotonic()
+        with self._lock:
+            for cr in self._pools:
+                self._low_since.setdefault(cr, now)
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._refill_loop,
+                                        name='HoardPool-refill', daemon=True)
+        self._thread.start()
+        self._wake.set()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the background refill thread.
+
+        If the timeout expires first, the thread is still tracked and
+        finishes its current hoard before exiting.
+        """
+        if self._thread is not None:
+            self._stopping.set()
+            self._wake.set()
+            self._thread.join(timeout)
+            if not self._thread.is_alive():
+                self._thread = None
+
+    def __enter__(self) -> 'HoardPool':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    # ------------------------------------------------------------------
+    # Serving
+    # ------------------------------------------------------------------
+
+    def take(self, cr: int) -> TreasureHoard:
+        """Return a ready hoard for a CR, generating one on a miss."""
+        pool = self._pools.get(cr)
+        try:
+            if pool is None:
+                raise IndexError(cr)
+            hoard = pool.popleft()
+        except IndexError:
+            # CR not pooled, or the buffer ran dry
+            with self._lock:
+                self._misses += 1
+            self._request_refill(cr)
+            hoard = self._generator(cr)
+            with self._lock:
+                self._generated += 1
+            return hoard
+
+        with self._lock:
+            self._hits += 1
+        if len(pool) < self.low_watermark:
+            self._request_refill(cr)
+        return hoard
+
+    def ready(self, cr: int) -> int:
+        """Return the number of hoards ready for a CR."""
+        pool = self._pools.get(cr)
+        return len(pool) if pool is not None else 0
+
+    def _request_refill(self, cr: int) -> None:
+        """Ask the refill thread to top up a CR."""
+        if cr not in self._pools:
+            return
+        with self._lock:
+            self._low_since.setdefault(cr, time.monotonic())
+        self._wake.set()
+
+    # ------------------------------------------------------------------
+    # Refilling
+    # ------------------------------------------------------------------
+
+    def _refill_loop(self) -> None:
+        """Top up every CR that was flagged as low until stopped."""
+        while not self._stopping.is_set():
+            self._wake.wait()
+            self._wake.clear()
+
+            # Also catch CRs that dipped while their last refill was running
+            with self._lock:
+                low = set(self._low_since)
+            low.update(cr for cr, pool in self._pools.items()
+                       if len(pool) < self.low_watermark)
+            low = sorted(low)
+            for cr in low:
+                if self._stopping.is_set():
+                    return
+                self._refill(cr, self._stopping)
+
+    def refill(self, cr: int) -> int:
+        """
+        Fill a CR to capacity now and return how many hoards were added.
+
+        Works whether or not the background thread is running.
+        """
+        return self._refill(cr, None)
+
+    def _refill(self, cr: int, stopping: Optional[threading.Event]) -> int:
+        """Fill a CR to capacity unless stopping is set first."""
+        pool = self._pools[cr]
+        added = 0
+        filled = True
+        while len(pool) < self.capacity:
+            if stopping is not None and stopping.is_set():
+                filled = False
+                break
+            pool.append(self._generator(cr))
+            added += 1
+
+        with self._lock:
+            self._generated += added
+            # An interrupted refill leaves the CR pending, lag unrecorded
+            started = self._low_since.pop(cr, None) if filled else None
+            if started is not None:
+                lag = time.monotonic() - started
+                self._refills += 1
+                self._lag_total += lag
+                self._lag_last = lag
+                self._lag_max = max(self._lag_max, lag)
+        return added
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def metrics(self) -> Dict:
+        """Return hit/miss counts, refill lag in seconds and buffer levels."""
+        with self._lock:
+            requests = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / requests if requests else 0.0,
+                'generated': self._generated,
+                'refills': self._refills,
+                'refill_lag_last': self._lag_last,
+                'refill_lag_mean': self._lag_total / self._refills if self._refills else 0.0,
+                'refill_lag_max': self._lag_max,
+                'pending_refills': len(self._low_since),
+                'ready': {cr: len(pool) for cr, pool in self._pools.items()},
+            }
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Hoard Report
+Bulk rendering of many treasure hoards with an optional campaign summary.
+
+Each hoard is rendered exactly as TreasureHoard.format_output() prints
+it, but from templates built once at import, with every hoard's total
+computed once and the text written to the output in large chunks. A
+report also keeps its own cache of rendered coin and item lines.
+"""
+
+import sys
+from typing import Dict, Iterable, List, Optional, TextIO, Tuple
+
+from treasure_generator import ITEM_GENERATORS, TreasureHoard, generate_treasure, item_category
+
+
+# ============================================================================
+# TEMPLATES
+# ============================================================================
+
+SEPARATOR = '=' * 60
+COIN_ORDER = ['pp', 'gp', 'sp', 'cp']
+
+HOARD_HEADER = f"\n{SEPARATOR}\nTREASURE HOARD - CR {{}}\n{SEPARATOR}\n\n"
+TOTAL_PREFIX = f"{SEPARATOR}\nTOTAL VALUE: "
+TOTAL_SUFFIX = f" gp\n{SEPARATOR}\n"
+NO_TREASURE = "No treasure found!\n\n"
+
+# Headers for the standard CRs, rendered once
+HOARD_HEADERS = {cr: HOARD_HEADER.format(cr) for cr in range(1, 21)}
+
+SUMMARY_HEADER = f"\n{SEPARATOR}\nCAMPAIGN SUMMARY - {{:,}} HOARDS\n{SEPARATOR}\n\n"
+
+# Hoards are written to the output once this many characters are queued
+DEFAULT_BUFFER_CHARS = 1 << 16
+
+# A report's line cache is cleared once it holds this many lines
+MAX_CACHED_LINES = 100000
+
+
+def render_hoard(hoard: TreasureHoard, total: Optional[int] = None,
+                 lines: Optional[Dict[Tuple, str]] = None) -> str:
+    """
+    Render one hoard, matching TreasureHoard.format_output().
+
+    Args:
+        hoard: Hoard to render
+        total: Its total value, if already known
+        lines: Cache of rendered coin and item lines to reuse and fill;
+            generated hoards repeat the same lines constantly
+    """
+    if lines is None:
+        lines = {}
+    elif len(lines) > MAX_CACHED_LINES:
+        lines.clear()
+    header = HOARD_HEADERS.get(hoard.cr)
+    if header is None:
+        header = HOARD_HEADER.format(hoard.cr)
+    parts = [header]
+    append = parts.append
+
+    coins = hoard.coins
+    if coins:
+        append("COINS:\n")
+        for coin_type in COIN_ORDER:
+            if coin_type in coins:
+                key = (coins[coin_type], coin_type)
+                line = lines.get(key)
+                if line is None:
+                    line = lines[key] = f"  {key[0]:,} {coin_type}\n"
+                append(line)
+        append("\n")
+
+    if hoard.goods:
+        append("GOODS:\n")
+        for item_desc, _ in hoard.goods:
+            append(f"  {item_desc}\n")
+        append("\n")
+
+    if hoard.items:
+        append("MAGIC ITEMS:\n")
+        for item in hoard.items:
+            line = lines.get(item)
+            if line is None:
+                line = lines[item] = f"  {item[0]} ({item[1]:,} gp)\n"
+            append(line)
+        append("\n")
+
+    if not coins and not hoard.goods and not hoard.items:
+        append(NO_TREASURE)
+
+    if total is None:
+        total = hoard.total_value()
+    append(f"{TOTAL_PREFIX}{total:,}{TOTAL_SUFFIX}")
+
+    return ''.join(parts)
+
+
+class CampaignSummary:
+    """Running totals across many hoards."""
+
+    def __init__(self):
+        self.hoards = 0
+        self.total_value = 0
+        self.coins: Dict[str, int] = {coin_type: 0 for coin_type in COIN_ORDER}
+        self.goods_count = 0
+        self.goods_value = 0
+        self.item_counts: Dict[str, int] = {category: 0 for category in ITEM_GENERATORS}
+        self.items_value = 0
+        self._categories: Dict[str, str] = {}
+
+    def add(self, hoard: TreasureHoard, total: int) -> None:
+        """Add one hoard whose total value is already known."""
+        self.hoards += 1
+        self.total_value += total
+
+        for coin_type, amount in hoard.coins.items():
+            self.coins[coin_type] += amount
+
+        if hoard.goods:
+            self.goods_count += len(hoard.goods)
+            for _, value in hoard.goods:
+                self.goods_value += value
+
+        for item_desc, price in hoard.items:
+            category = self._categories.get(item_desc)
+            if category is None:
+                category = self._categories[item_desc] = item_category(item_desc)
+            self.item_counts[category] += 1
+            self.items_value += price
+
+    def format_output(self) -> str:
+        """Format the summary in the same layout as a hoard."""
+        lines = [SUMMARY_HEADER.format(self.hoards), "COINS:\n"]
+        for coin_type in COIN_ORDER:
+            lines.append(f"  {self.coins[coin_type]:,} {coin_type}\n")
+        lines.append("\n")
+
+        lines.append("GOODS:\n")
+        lines.append(f"  Total: {self.goods_count:,} ({self.goods_value:,} gp)\n")
+        lines.append("\n")
+
+        lines.append("MAGIC ITEMS:\n")
+        for category, count in self.item_counts.items():
+            lines.append(f"  {category}: {count:,}\n")
+        lines.append(f"  Total: {sum(self.item_counts.values()):,} ({self.items_value:,} gp)\n")
+        lines.append("\n")
+
+        lines.append(f"{TOTAL_PREFIX}{self.total_value:,}{TOTAL_SUFFIX}")
+        return ''.join(lines)
+
+
+class HoardReport:
+    """Writes many hoards to one output, buffering the rendered text."""
+
+    def __init__(self, out: TextIO, summary: bool = False,
+                 buffer_chars: int = DEFAULT_BUFFER_CHARS):
+        self.out = out
+        self.summary = CampaignSummary() if summary else None
+        self._buffer_chars = buffer_chars
+        self._pending: List[str] = []
+        self._pending_chars = 0
+        self._lines: Dict[Tuple, str] = {}
+
+    def write(self, hoard: TreasureHoard) -> None:
+        """Render a hoard as print(hoard.format_output()) would."""
+        total = hoard.total_value()
+        if self.summary is not None:
+            self.summary.add(hoard, total)
+
+        text = render_hoard(hoard, total, self._lines)
+        self._pending.append(text)
+        self._pending.append("\n")
+        self._pending_chars += len(text) + 1
+        if self._pending_chars >= self._buffer_chars:
+            self.flush()
+
+    def write_all(self, hoards: Iterable[TreasureHoard]) -> None:
+        """Render every hoard in order."""
+        for hoard in hoards:
+            self.write(hoard)
+
+    def write_summary(self) -> None:
+        """Append the campaign summary for everything written so far."""
+        if self.summary is None:
+            raise ValueError("HoardReport was created without a summary")
+        self._pending.append(self.summary.format_output())
+        self._pending.append("\n")
+        self.flush()
+
+    def flush(self) -> None:
+        """Write any queued text to the output."""
+        if self._pending:
+            self.out.write(''.join(self._pending))
+            self._pending = []
+            self._pending_chars = 0
+
+
+def render_hoards(hoards: Iterable[TreasureHoard], out: TextIO,
+                  summary: bool = False) -> Optional[CampaignSummary]:
+    """Write hoards to out, optionally followed by a campaign summary."""
+    report = HoardReport(out, summary)
+    report.write_all(hoards)
+    if summary:
+        report.write_summary()
+    report.flush()
+    return report.summary
+
+
+def print_usage():
+    """Print usage information."""
+    print("""
+Hoard Report
+============
+
+Usage:
+  python hoard_report.py CR COUNT [--summary]
+
+Arguments:
+  CR         Challenge Rating (1-20+) for every hoard
+  COUNT      Number of hoards to generate
+  --summary  Append a campaign summary after the hoards
+
+Examples:
+  python hoard_report.py 12 1000 --summary > campaign.txt
+""")
+
+
+def main():
+    """Main entry point."""
+    args = [a for a in sys.argv[1:] if a != '--summary']
+    summary = '--summary' in sys.argv[1:]
+
+    if len(args) != 2 or args[0] in ['-h', '--help', 'help']:
+        print_usage()
+        sys.exit(0 if args and args[0] in ['-h', '--help', 'help'] else 1)
+
+    try:
+        cr = int(args[0])
+        count = int(args[1])
+    except ValueError:
+        print("Error: CR and COUNT must be numbers")
+        sys.exit(1)
+
+    if cr < 1:
+        print("Error: CR must be at least 1")
+        sys.exit(1)
+
+    hoards = (generate_treasure(cr) for _ in range(count))
+    render_hoards(hoards, sys.stdout, summary)
+
+
+if __name__ == '__main__':
+    main()
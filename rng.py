@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Random Number Source
+Per-thread random number generators for the dice roller and treasure generator.
+
+Each thread draws from its own generator, so concurrent callers never
+share state or contend on a lock. Generators are random.Random
+instances, so every draw is a single call into the C-level Mersenne
+Twister; callers fetch the thread's generator once with get_instance()
+and call its bound methods directly.
+
+The main thread uses the random module itself, so random.seed() still
+makes a run reproducible. Seeded results are not the same as before the
+dice kernel, though: table-driven dice sums consume different draws, so
+a given seed now produces different hoards.
+"""
+
+import random as _random
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+
+# get_instance() returns a generator private to the calling thread.
+# Worker threads' generators are seeded from a shared seeder, so seed()
+# also makes the generators of threads started afterwards reproducible.
+_local = threading.local()
+_seeder = _random.Random()
+_seeder_lock = threading.Lock()
+
+
+def _new_instance() -> Any:
+    """Create the generator for the calling thread."""
+    if threading.current_thread() is threading.main_thread():
+        inst = _random
+    else:
+        with _seeder_lock:
+            seed_bits = _seeder.getrandbits(128)
+        inst = _random.Random(seed_bits)
+    _local.inst = inst
+    return inst
+
+
+def get_instance() -> Any:
+    """Return the calling thread's generator (random.Random compatible)."""
+    try:
+        return _local.inst
+    except AttributeError:
+        return _new_instance()
+
+
+@contextmanager
+def using(generator: Any) -> Iterator[Any]:
+    """
+    Serve the calling thread's draws from another generator for a while.
+
+    Any object with the random.Random methods works, such as
+    random.Random(seed) for an isolated, reproducible stream.
+    """
+    previous = getattr(_local, 'inst', None)
+    _local.inst = generator
+    try:
+        yield generator
+    finally:
+        if previous is None:
+            del _local.inst
+        else:
+            _local.inst = previous
+
+
+def seed(a: Optional[Any] = None) -> None:
+    """Reseed the calling thread's generator and the seeder for new threads."""
+    with _seeder_lock:
+        _seeder.seed(a)
+    get_instance().seed(a)
+
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Roll Statistics
+Constant-memory accumulators for summarizing many dice rolls.
+
+Mean and variance use Welford's online algorithm, quantiles use the
+P-squared estimator (Jain & Chlamtac), and the histogram has a fixed
+number of bins over the known range of the roll.
+"""
+
+import math
+from typing import Dict, List, Sequence, Tuple
+
+
+class P2Quantile:
+    """Streaming estimate of a single quantile using five markers."""
+
+    def __init__(self, p: float):
+        if not 0 < p < 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        self.p = p
+        self._initial: List[float] = []
+        self._heights: List[float] = []
+        self._positions: List[int] = []
+        self._desired: List[float] = []
+        self._increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, x: float) -> None:
+        """Add one observation."""
+        if len(self._initial) < 5:
+            self._initial.append(x)
+            if len(self._initial) == 5:
+                self._initial.sort()
+                self._heights = list(self._initial)
+                self._positions = [1, 2, 3, 4, 5]
+                p = self.p
+                self._desired = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+            return
+
+        q = self._heights
+        n = self._positions
+
+        # Find the cell containing x, stretching the extremes if needed
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # Move the middle markers toward their desired positions
+        for i in range(1, 4):
+            d = self._desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                candidate = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if q[i - 1] < candidate < q[i + 1]:
+                    q[i] = candidate
+                else:
+                    q[i] += d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                n[i] += d
+
+    def value(self) -> float:
+        """Return the current estimate."""
+        if len(self._initial) < 5:
+            if not self._initial:
+                return math.nan
+            ordered = sorted(self._initial)
+            return ordered[min(len(ordered) - 1, int(self.p * len(ordered)))]
+        return self._heights[2]
+
+
+class RollStats:
+    """Running summary of integer roll totals within a known range."""
+
+    QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+    def __init__(self, low: int, high: int, bins: int = 20,
+                 quantiles: Sequence[float] = QUANTILES):
+        if high < low:
+            raise ValueError("high must be at least low")
+        self.low = low
+        self.high = high
+        self.count = 0
+        self.min = None
+        self.max = None
+        self._mean = 0.0
+        self._m2 = 0.0
+
+        span = high - low + 1
+        self._bin_width = max(1, math.ceil(span / bins))
+        self._bins = [0] * math.ceil(span / self._bin_width)
+        self._quantiles = [P2Quantile(p) for p in quantiles]
+
+    def add(self, x: int) -> None:
+        """Add one roll total."""
+        self.count += 1
+        delta = x - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (x - self._mean)
+
+        if self.min is None or x < self.min:
+            self.min = x
+        if self.max is None or x > self.max:
+            self.max = x
+
+        index = (x - self.low) // self._bin_width
+        self._bins[min(len(self._bins) - 1, max(0, index))] += 1
+
+        for estimator in self._quantiles:
+            estimator.add(x)
+
+    @property
+    def mean(self) -> float:
+        return self._mean if self.count else math.nan
+
+    @property
+    def variance(self) -> float:
+        """Sample variance of the totals seen so far."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def histogram(self) -> List[Tuple[int, int, int]]:
+        """Return (bin low, bin high, count) for every bin."""
+        result = []
+        for i, count in enumerate(self._bins):
+            bin_low = self.low + i * self._bin_width
+            bin_high = min(self.high, bin_low + self._bin_width - 1)
+            result.append((bin_low, bin_high, count))
+        return result
+
+    def quantiles(self) -> Dict[float, float]:
+        """Return the estimated value at each tracked quantile."""
+        return {e.p: e.value() for e in self._quantiles}
+
+    def to_dict(self) -> Dict:
+        """Return the summary as JSON-serializable data."""
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'stddev': self.stddev,
+            'variance': self.variance,
+            'min': self.min,
+            'max': self.max,
+            'quantiles': {f"p{p * 100:g}": v for p, v in self.quantiles().items()},
+            'histogram': [
+                {'low': lo, 'high': hi, 'count': c} for lo, hi, c in self.histogram()
+            ],
+        }
+
+    def format_summary(self, title: str = "") -> str:
+        """Format the summary for display."""
+        output = []
+        if title:
+            output.append(f"\n{title}:")
+        output.append(f"  Rolls: {self.count:,}")
+        output.append(f"  Mean: {self.mean:.3f}  Std dev: {self.stddev:.3f}")
+        output.append(f"  Min: {self.min}  Max: {self.max}")
+        output.append("  Quantiles: " + ", ".join(
+            f"p{p * 100:g}={v:.1f}" for p, v in self.quantiles().items()))
+
+        output.append("  Histogram:")
+        peak = max(self._bins) or 1
+        for lo, hi, c in self.histogram():
+            label = f"{lo}" if lo == hi else f"{lo}-{hi}"
+            bar = '#' * round(40 * c / peak)
+            output.append(f"    {label:>11} | {bar} {c:,}")
+
+        return '\n'.join(output)
@@ -4,10 +4,12 @@ D&D 3.5 Treasure Generator
 Based on DMG 3.5 treasure tables and Magic Item Compendium
 """
 
-import random
 import sys
 from typing import Dict, List, Tuple, Optional
 
+import dice_kernel
+import rng
+
 
 # ============================================================================
 # TREASURE TABLES BY CR (DMG Table 3-3)
@@ -41,9 +43,19 @@ TREASURE_TABLES = {
 # COIN TYPES AND DISTRIBUTION
 # ============================================================================
 
+# Dice shapes rolled by the generators below
+DICE_SHAPES = sorted(
+    {(num, int(die[1:])) for num, die, _, _ in
+     (t['coins'] for t in TREASURE_TABLES.values())}
+    | {(3, 6), (2, 6), (2, 8), (1, 4), (2, 4)}
+)
+
+dice_kernel.precompute(DICE_SHAPES)
+
+
 def roll_dice(num: int, sides: int, multiplier: int = 1) -> int:
     """Roll dice and return result."""
-    return sum(random.randint(1, sides) for _ in range(num)) * multiplier
+    return dice_kernel.roll_sum(num, sides) * multiplier
 
 
 def generate_coins(cr: int) -> Dict[str, int]:
@@ -109,12 +121,13 @@ ART_OBJECTS = {
 def generate_goods(cr: int) -> List[Tuple[str, int]]:
     """Generate gems and art objects."""
     goods = []
+    rand = rng.get_instance()
 
     if cr not in TREASURE_TABLES:
         cr = min(20, max(1, cr))
 
     chance = TREASURE_TABLES[cr]['goods']
-    if random.random() > chance:
+    if rand.random() > chance:
         return goods
 
     # Number of items based on CR
@@ -122,7 +135,7 @@ def generate_goods(cr: int) -> List[Tuple[str, int]]:
 
     for _ in range(num_items):
         # Choose gem or art
-        is_gem = random.random() < 0.7
+        is_gem = rand.random() < 0.7
 
         # Select value based on CR
         if cr <= 4:
@@ -138,13 +151,13 @@ def generate_goods(cr: int) -> List[Tuple[str, int]]:
         else:
             values = [1000, 5000]
 
-        value = random.choice(values)
+        value = rand.choice(values)
 
         if is_gem and value in GEMS:
-            item_desc = random.choice(GEMS[value])
+            item_desc = rand.choice(GEMS[value])
             goods.append((f"Gem ({value} gp): {item_desc}", value))
         elif not is_gem and value in ART_OBJECTS:
-            item_desc = random.choice(ART_OBJECTS[value])
+            item_desc = rand.choice(ART_OBJECTS[value])
             goods.append((f"Art ({value} gp): {item_desc}", value))
 
     return goods
@@ -201,34 +214,60 @@ def get_weapon_price(enhancement: int, brands: List[str] = None) -> int:
     return base_weapon_price + bonus_price + brand_cost
 
 
-def generate_magic_weapon(cr: int) -> Tuple[str, int]:
-    """Generate a magic weapon."""
-    # Enhancement bonus based on CR
+ALL_BRANDS = tuple(WEAPON_BRANDS)
+MINOR_BRANDS = tuple(k for k, v in WEAPON_BRANDS.items() if v[0] <= 2)
+
+
+def weapon_options(cr: int) -> Tuple[Tuple[int, ...], float, Tuple[str, ...], Tuple[int, ...]]:
+    """
+    Return the magic weapon choices for a CR.
+
+    Returns:
+        Tuple of (enhancement choices, chance of brands, brand pool,
+        brand count choices)
+    """
     if cr <= 5:
-        enhancement = 1
-        brands = []
+        return (1,), 0.0, (), (1,)
     elif cr <= 8:
-        enhancement = random.choice([1, 1, 1, 2])
-        brands = [random.choice(list(WEAPON_BRANDS.keys()))] if random.random() < 0.3 else []
+        return (1, 1, 1, 2), 0.3, ALL_BRANDS, (1,)
     elif cr <= 12:
-        enhancement = random.choice([1, 2, 2, 2])
-        brands = [random.choice(list(WEAPON_BRANDS.keys()))] if random.random() < 0.5 else []
+        return (1, 2, 2, 2), 0.5, ALL_BRANDS, (1,)
     elif cr <= 16:
-        enhancement = random.choice([2, 2, 3, 3])
-        brands = [random.choice([k for k, v in WEAPON_BRANDS.items() if v[0] <= 2])]
+        return (2, 2, 3, 3), 1.0, MINOR_BRANDS, (1,)
     else:
-        enhancement = random.choice([3, 3, 4, 4, 5])
-        brands = random.sample([k for k, v in WEAPON_BRANDS.items() if v[0] <= 2],
-                              random.choice([1, 1, 2]))
+        return (3, 3, 4, 4, 5), 1.0, MINOR_BRANDS, (1, 1, 2)
 
-    weapon_type = random.choice(WEAPON_TYPES)
 
-    # Build description
+def weapon_description(enhancement: int, brands: List[str], weapon_type: str) -> str:
+    """Build the display name of a magic weapon."""
     desc = f"+{enhancement}"
     if brands:
         desc += " " + " ".join(brands)
     desc += f" {weapon_type}"
+    return desc
+
+
+def generate_magic_weapon(cr: int) -> Tuple[str, int]:
+    """Generate a magic weapon."""
+    rand = rng.get_instance()
+    # Enhancement bonus and brands based on CR
+    enhancements, brand_chance, brand_pool, brand_counts = weapon_options(cr)
+
+    if len(enhancements) == 1:
+        enhancement = enhancements[0]
+    else:
+        enhancement = rand.choice(enhancements)
 
+    brands = []
+    if brand_chance >= 1 or (brand_chance > 0 and rand.random() < brand_chance):
+        if brand_counts == (1,):
+            brands = [rand.choice(brand_pool)]
+        else:
+            brands = rand.sample(brand_pool, rand.choice(brand_counts))
+
+    weapon_type = rand.choice(WEAPON_TYPES)
+
+    desc = weapon_description(enhancement, brands, weapon_type)
     price = get_weapon_price(enhancement, brands)
 
     return (desc, price)
@@ -245,20 +284,34 @@ ARMOR_TYPES = [
 ]
 
 
-def generate_magic_armor(cr: int) -> Tuple[str, int]:
-    """Generate magic armor."""
+def get_armor_price(enhancement: int) -> int:
+    """Calculate armor price based on enhancement."""
+    base_armor_price = 150  # Average
+    return base_armor_price + (enhancement ** 2) * 1000
+
+
+def armor_enhancements(cr: int) -> Tuple[int, ...]:
+    """Return the armor enhancement choices for a CR."""
     if cr <= 6:
-        enhancement = 1
+        return (1,)
     elif cr <= 10:
-        enhancement = random.choice([1, 1, 2])
+        return (1, 1, 2)
     elif cr <= 14:
-        enhancement = random.choice([2, 2, 3])
+        return (2, 2, 3)
     else:
-        enhancement = random.choice([3, 4, 5])
+        return (3, 4, 5)
 
-    armor_type = random.choice(ARMOR_TYPES)
-    base_armor_price = 150  # Average
-    price = base_armor_price + (enhancement ** 2) * 1000
+
+def generate_magic_armor(cr: int) -> Tuple[str, int]:
+    """Generate magic armor."""
+    rand = rng.get_instance()
+    enhancements = armor_enhancements(cr)
+    if len(enhancements) == 1:
+        enhancement = enhancements[0]
+    else:
+        enhancement = rand.choice(enhancements)
+    armor_type = rand.choice(ARMOR_TYPES)
+    price = get_armor_price(enhancement)
 
     return (f"+{enhancement} {armor_type}", price)
 
@@ -286,17 +339,25 @@ POTION_TYPES = [
 ]
 
 
-def generate_potion(cr: int) -> Tuple[str, int]:
-    """Generate a potion."""
-    # Filter by CR
+# Potions available at each CR tier, see potion_options()
+_POTIONS_LOW = tuple(p for p in POTION_TYPES if p[1] <= 300)
+_POTIONS_MID = tuple(p for p in POTION_TYPES if p[1] <= 750)
+_POTIONS_ALL = tuple(POTION_TYPES)
+
+
+def potion_options(cr: int) -> Tuple[Tuple[str, int], ...]:
+    """Return the potions available at a CR."""
     if cr <= 5:
-        valid = [p for p in POTION_TYPES if p[1] <= 300]
+        return _POTIONS_LOW
     elif cr <= 10:
-        valid = [p for p in POTION_TYPES if p[1] <= 750]
+        return _POTIONS_MID
     else:
-        valid = POTION_TYPES
+        return _POTIONS_ALL
 
-    name, price = random.choice(valid)
+
+def generate_potion(cr: int) -> Tuple[str, int]:
+    """Generate a potion."""
+    name, price = rng.get_instance().choice(potion_options(cr))
     return (f"Potion of {name}", price)
 
 
@@ -320,8 +381,14 @@ SCROLL_SPELLS = [
 ]
 
 
-def generate_scroll(cr: int) -> Tuple[str, int]:
-    """Generate a scroll."""
+# Scroll spells available up to each spell level, see scroll_options()
+_SCROLLS_BY_LEVEL = {
+    level: tuple(s for s in SCROLL_SPELLS if s[2] <= level) for level in range(1, 5)
+}
+
+
+def scroll_options(cr: int) -> Tuple[Tuple[str, int, int], ...]:
+    """Return the scroll spells available at a CR."""
     if cr <= 4:
         max_level = 1
     elif cr <= 8:
@@ -331,8 +398,12 @@ def generate_scroll(cr: int) -> Tuple[str, int]:
     else:
         max_level = 4
 
-    valid = [s for s in SCROLL_SPELLS if s[2] <= max_level]
-    spell, price, level = random.choice(valid)
+    return _SCROLLS_BY_LEVEL[max_level]
+
+
+def generate_scroll(cr: int) -> Tuple[str, int]:
+    """Generate a scroll."""
+    spell, price, level = rng.get_instance().choice(scroll_options(cr))
 
     return (f"Scroll of {spell}", price)
 
@@ -347,19 +418,30 @@ WAND_SPELLS = [
 ]
 
 
-def generate_wand(cr: int) -> Tuple[str, int]:
-    """Generate a wand with 50 charges."""
+WAND_CHARGES = 50  # Standard new wand
+
+
+# Wand spells available at each CR tier, see wand_options()
+_WANDS_LOW = tuple(w for w in WAND_SPELLS if w[1] <= 750)
+_WANDS_MID = tuple(w for w in WAND_SPELLS if w[1] <= 4500)
+_WANDS_ALL = tuple(WAND_SPELLS)
+
+
+def wand_options(cr: int) -> Tuple[Tuple[str, int], ...]:
+    """Return the wand spells available at a CR."""
     if cr <= 8:
-        valid = [w for w in WAND_SPELLS if w[1] <= 750]
+        return _WANDS_LOW
     elif cr <= 12:
-        valid = [w for w in WAND_SPELLS if w[1] <= 4500]
+        return _WANDS_MID
     else:
-        valid = WAND_SPELLS
+        return _WANDS_ALL
+
 
-    spell, price = random.choice(valid)
-    charges = 50  # Standard new wand
+def generate_wand(cr: int) -> Tuple[str, int]:
+    """Generate a wand with 50 charges."""
+    spell, price = rng.get_instance().choice(wand_options(cr))
 
-    return (f"Wand of {spell} ({charges} charges)", price)
+    return (f"Wand of {spell} ({WAND_CHARGES} charges)", price)
 
 
 # ============================================================================
@@ -412,115 +494,163 @@ WONDROUS_ITEMS = [
 ]
 
 
-def generate_ring(cr: int) -> Tuple[str, int]:
-    """Generate a magic ring."""
+# Rings and wondrous items available at each CR tier, see ring_options()
+# and wondrous_options()
+_RINGS_LOW = tuple(r for r in RINGS if r[1] <= 4000)
+_RINGS_MID = tuple(r for r in RINGS if r[1] <= 10000)
+_RINGS_ALL = tuple(RINGS)
+
+_WONDROUS_LOW = tuple(w for w in WONDROUS_ITEMS if w[1] <= 2500)
+_WONDROUS_MID = tuple(w for w in WONDROUS_ITEMS if w[1] <= 5000)
+_WONDROUS_HIGH = tuple(w for w in WONDROUS_ITEMS if w[1] <= 15000)
+_WONDROUS_ALL = tuple(WONDROUS_ITEMS)
+
+
+def ring_options(cr: int) -> Tuple[Tuple[str, int], ...]:
+    """Return the rings available at a CR."""
     if cr <= 8:
-        valid = [r for r in RINGS if r[1] <= 4000]
+        return _RINGS_LOW
     elif cr <= 14:
-        valid = [r for r in RINGS if r[1] <= 10000]
+        return _RINGS_MID
     else:
-        valid = RINGS
+        return _RINGS_ALL
 
-    return random.choice(valid)
 
-
-def generate_wondrous_item(cr: int) -> Tuple[str, int]:
-    """Generate a wondrous item."""
+def wondrous_options(cr: int) -> Tuple[Tuple[str, int], ...]:
+    """Return the wondrous items available at a CR."""
     if cr <= 6:
-        valid = [w for w in WONDROUS_ITEMS if w[1] <= 2500]
+        return _WONDROUS_LOW
     elif cr <= 10:
-        valid = [w for w in WONDROUS_ITEMS if w[1] <= 5000]
+        return _WONDROUS_MID
     elif cr <= 14:
-        valid = [w for w in WONDROUS_ITEMS if w[1] <= 15000]
+        return _WONDROUS_HIGH
     else:
-        valid = WONDROUS_ITEMS
+        return _WONDROUS_ALL
+
+
+def generate_ring(cr: int) -> Tuple[str, int]:
+    """Generate a magic ring."""
+    return rng.get_instance().choice(ring_options(cr))
+
 
-    return random.choice(valid)
+def generate_wondrous_item(cr: int) -> Tuple[str, int]:
+    """Generate a wondrous item."""
+    return rng.get_instance().choice(wondrous_options(cr))
 
 
 # ============================================================================
 # ITEM GENERATION
 # ============================================================================
 
+ITEM_GENERATORS = {
+    'weapon': generate_magic_weapon,
+    'armor': generate_magic_armor,
+    'potion': generate_potion,
+    'scroll': generate_scroll,
+    'wand': generate_wand,
+    'ring': generate_ring,
+    'wondrous': generate_wondrous_item,
+}
+
+
+# Description -> ITEM_GENERATORS category for every item with a fixed
+# name, taken from the same tables the generators draw from
+_FIXED_ITEM_CATEGORIES: Dict[str, str] = {}
+_FIXED_ITEM_CATEGORIES.update((f"Potion of {name}", 'potion') for name, _ in POTION_TYPES)
+_FIXED_ITEM_CATEGORIES.update((f"Scroll of {spell}", 'scroll') for spell, _, _ in SCROLL_SPELLS)
+_FIXED_ITEM_CATEGORIES.update((f"Wand of {spell} ({WAND_CHARGES} charges)", 'wand')
+                              for spell, _ in WAND_SPELLS)
+_FIXED_ITEM_CATEGORIES.update((name, 'ring') for name, _ in RINGS)
+_FIXED_ITEM_CATEGORIES.update((name, 'wondrous') for name, _ in WONDROUS_ITEMS)
+
+
+def item_category(desc: str) -> str:
+    """Return the ITEM_GENERATORS category of a generated item description."""
+    category = _FIXED_ITEM_CATEGORIES.get(desc)
+    if category is not None:
+        return category
+
+    # Weapons and armor are named "+N [brands] <type>"
+    if desc.startswith('+'):
+        base = desc.split(' ', 1)[-1]
+        if base in ARMOR_TYPES:
+            return 'armor'
+        if any(base == w or base.endswith(' ' + w) for w in WEAPON_TYPES):
+            return 'weapon'
+    raise ValueError(f"Unknown item: {desc}")
+
+
+def item_count_options(cr: int) -> Tuple[int, ...]:
+    """Return the choices for how many magic items a hoard holds."""
+    if cr <= 5:
+        return (1,)
+    elif cr <= 10:
+        return (1, 1, 2)
+    elif cr <= 15:
+        return (1, 2, 2, 3)
+    else:
+        return (2, 2, 3, 3, 4)
+
+
+# Item type tables by CR tier, see item_type_table()
+
+# Low level: mostly potions and scrolls
+_ITEM_TYPES_LOW = ((0.4, 'potion'), (0.8, 'scroll'), (1.0, 'wondrous'))
+
+# Mid-low: varied with some weapons/armor
+_ITEM_TYPES_MID_LOW = ((0.2, 'weapon'), (0.35, 'armor'), (0.55, 'potion'),
+                       (0.70, 'scroll'), (0.85, 'wondrous'), (1.0, 'ring'))
+
+# Mid: more weapons/armor, add wands
+_ITEM_TYPES_MID = ((0.25, 'weapon'), (0.45, 'armor'), (0.55, 'potion'), (0.65, 'scroll'),
+                   (0.75, 'wand'), (0.87, 'wondrous'), (1.0, 'ring'))
+
+# High: emphasis on permanent items
+_ITEM_TYPES_HIGH = ((0.30, 'weapon'), (0.50, 'armor'), (0.55, 'potion'), (0.60, 'scroll'),
+                    (0.70, 'wand'), (0.85, 'wondrous'), (1.0, 'ring'))
+
+
+def item_type_table(cr: int) -> Tuple[Tuple[float, str], ...]:
+    """
+    Return the item type table for a CR.
+
+    Each entry is (threshold, category); a roll in [0, 1) selects the
+    first category whose threshold it is below.
+    """
+    if cr <= 4:
+        return _ITEM_TYPES_LOW
+    elif cr <= 8:
+        return _ITEM_TYPES_MID_LOW
+    elif cr <= 12:
+        return _ITEM_TYPES_MID
+    else:
+        return _ITEM_TYPES_HIGH
+
+
 def generate_magic_items(cr: int) -> List[Tuple[str, int]]:
     """Generate magic items based on CR."""
     items = []
+    rand = rng.get_instance()
 
     if cr not in TREASURE_TABLES:
         cr = min(20, max(1, cr))
 
     chance = TREASURE_TABLES[cr]['items']
-    if random.random() > chance:
+    if rand.random() > chance:
         return items
 
     # Number of items
-    if cr <= 5:
-        num_items = 1
-    elif cr <= 10:
-        num_items = random.choice([1, 1, 2])
-    elif cr <= 15:
-        num_items = random.choice([1, 2, 2, 3])
-    else:
-        num_items = random.choice([2, 2, 3, 3, 4])
+    counts = item_count_options(cr)
+    num_items = counts[0] if len(counts) == 1 else rand.choice(counts)
+    type_table = item_type_table(cr)
 
     for _ in range(num_items):
         # Choose item type
-        roll = random.random()
-
-        if cr <= 4:
-            # Low level: mostly potions and scrolls
-            if roll < 0.4:
-                items.append(generate_potion(cr))
-            elif roll < 0.8:
-                items.append(generate_scroll(cr))
-            else:
-                items.append(generate_wondrous_item(cr))
-        elif cr <= 8:
-            # Mid-low: varied with some weapons/armor
-            if roll < 0.2:
-                items.append(generate_magic_weapon(cr))
-            elif roll < 0.35:
-                items.append(generate_magic_armor(cr))
-            elif roll < 0.55:
-                items.append(generate_potion(cr))
-            elif roll < 0.70:
-                items.append(generate_scroll(cr))
-            elif roll < 0.85:
-                items.append(generate_wondrous_item(cr))
-            else:
-                items.append(generate_ring(cr))
-        elif cr <= 12:
-            # Mid: more weapons/armor, add wands
-            if roll < 0.25:
-                items.append(generate_magic_weapon(cr))
-            elif roll < 0.45:
-                items.append(generate_magic_armor(cr))
-            elif roll < 0.55:
-                items.append(generate_potion(cr))
-            elif roll < 0.65:
-                items.append(generate_scroll(cr))
-            elif roll < 0.75:
-                items.append(generate_wand(cr))
-            elif roll < 0.87:
-                items.append(generate_wondrous_item(cr))
-            else:
-                items.append(generate_ring(cr))
-        else:
-            # High: emphasis on permanent items
-            if roll < 0.30:
-                items.append(generate_magic_weapon(cr))
-            elif roll < 0.50:
-                items.append(generate_magic_armor(cr))
-            elif roll < 0.55:
-                items.append(generate_potion(cr))
-            elif roll < 0.60:
-                items.append(generate_scroll(cr))
-            elif roll < 0.70:
-                items.append(generate_wand(cr))
-            elif roll < 0.85:
-                items.append(generate_wondrous_item(cr))
-            else:
-                items.append(generate_ring(cr))
+        roll = rand.random()
+        for threshold, category in type_table:
+            if roll < threshold:
+                items.append(ITEM_GENERATORS[category](cr))
+                break
 
     return items
 